@@ -1,23 +1,57 @@
 import os
-import json
+import re
 import sys
-from typing import Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 from pandas import DataFrame
 
-from evidently.core.report import Report
-from evidently.presets import DataDriftPreset
-
 from PredictiveAnalytics.exception import PredictiveAnalyticsException
 from PredictiveAnalytics.logger import logging
-from PredictiveAnalytics.utils.main_utils import read_yaml_file, write_yaml_file
+from PredictiveAnalytics.utils.main_utils import (
+    read_yaml_file,
+    write_json_file,
+    write_yaml_file,
+)
 from PredictiveAnalytics.entity.artifact_entity import (
     DataIngestionArtifact,
     DataValidationArtifact,
 )
 from PredictiveAnalytics.entity.config_entity import DataValidationConfig
-from PredictiveAnalytics.constants import SCHEMA_FILE_PATH
+from PredictiveAnalytics.constants import SCHEMA_FILE_PATH, TARGET_COLUMN
+
+# Evidently's default share of drifted columns that flags dataset drift
+DEFAULT_DRIFT_SHARE_THRESHOLD: float = 0.5
+
+# p-value below which a column counts as drifted in fast_drift_report
+FAST_DRIFT_P_VALUE_THRESHOLD: float = 0.05
+
+# Shared read-only default for .get() on optional nested report dicts
+_EMPTY_MAPPING = MappingProxyType({})
+
+# Schema column types mapped to the dtypes passed to pd.read_csv. Numerical
+# labels are not mapped: schema.yaml says prevailing_wage is int while the data
+# holds floats, and columns may contain NaN, so numerics are left to inference.
+_SCHEMA_DTYPES: Dict[str, str] = {"category": "category"}
+
+# Parsed schema per path, keyed on file mtime so edits to the YAML are picked up.
+_SCHEMA_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+
+def _load_schema_cached(file_path: str) -> Dict[str, Any]:
+    """
+    Return the parsed schema YAML, re-reading it only when its mtime changes.
+    """
+    mtime = os.path.getmtime(file_path)
+    entry = _SCHEMA_CACHE.get(file_path)
+    if entry is not None and entry[0] == mtime:
+        return entry[1]
+
+    schema = read_yaml_file(file_path)
+    _SCHEMA_CACHE[file_path] = (mtime, schema)
+    return schema
 
 
 class DataValidation:
@@ -37,8 +71,40 @@ class DataValidation:
         try:
             self.data_ingestion_artifact = data_ingestion_artifact
             self.data_validation_config = data_validation_config
-            self._schema_config: Dict[str,
-                                      Any] = read_yaml_file(SCHEMA_FILE_PATH)
+            self._schema_config: Dict[str, Any] = _load_schema_cached(
+                SCHEMA_FILE_PATH)
+
+            # Precomputed views of the schema used by the validators
+            self._required_col_count = len(self._schema_config["columns"])
+            self._numerical_set = frozenset(
+                self._schema_config["numerical_columns"])
+            self._categorical_set = frozenset(
+                self._schema_config["categorical_columns"])
+            self._numerical_index = pd.Index(
+                self._schema_config["numerical_columns"])
+            self._categorical_index = pd.Index(
+                self._schema_config["categorical_columns"])
+            # ID-like/unused columns; never typed as category or drift-tested
+            self._drop_set = frozenset(self._schema_config["drop_columns"])
+            # categorical features that drift detection works on as codes
+            self._categorical_features = self._categorical_index.difference(
+                pd.Index(self._schema_config["drop_columns"]), sort=False)
+
+            self._expected_cols = [
+                col for column in self._schema_config["columns"]
+                for col in column
+            ]
+
+            # dtype hints for read_csv so pandas does not have to infer them.
+            # drop_columns (e.g. the unique case_id) stay plain strings: as a
+            # category they make Evidently run a categorical test over
+            # thousands of one-off IDs, which is slow and always "drifted".
+            self._csv_dtype_map: Dict[str, str] = {
+                col: _SCHEMA_DTYPES[col_type]
+                for column in self._schema_config["columns"]
+                for col, col_type in column.items()
+                if col_type in _SCHEMA_DTYPES and col not in self._drop_set
+            }
 
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys)
@@ -51,61 +117,107 @@ class DataValidation:
         """
         Validate number of columns matches schema.
         """
-        try:
-            required_cols = len(self._schema_config["columns"])
-            actual_cols = len(df.columns)
-            status = required_cols == actual_cols
+        required_cols = self._required_col_count
+        actual_cols = len(df.columns)
+        status = required_cols == actual_cols
 
-            logging.info(
-                f"Column count validation: required={required_cols}, actual={actual_cols}, status={status}"
-            )
-            return status
-
-        except Exception as e:
-            raise PredictiveAnalyticsException(e, sys)
+        logging.info(
+            f"Column count validation: required={required_cols}, actual={actual_cols}, status={status}"
+        )
+        return status
 
     def is_column_exist(self, df: DataFrame) -> bool:
         """
         Validate required numerical and categorical columns exist.
         """
-        try:
-            df_columns = set(df.columns)
+        missing_numerical = self._numerical_index[
+            ~self._numerical_index.isin(df.columns)].tolist()
+        missing_categorical = self._categorical_index[
+            ~self._categorical_index.isin(df.columns)].tolist()
 
-            missing_numerical = [
-                col for col in self._schema_config["numerical_columns"]
-                if col not in df_columns
-            ]
-            missing_categorical = [
-                col for col in self._schema_config["categorical_columns"]
-                if col not in df_columns
-            ]
+        if missing_numerical:
+            logging.info(f"Missing numerical columns: {missing_numerical}")
 
-            if missing_numerical:
-                logging.info(f"Missing numerical columns: {missing_numerical}")
+        if missing_categorical:
+            logging.info(f"Missing categorical columns: {missing_categorical}")
 
-            if missing_categorical:
-                logging.info(
-                    f"Missing categorical columns: {missing_categorical}")
+        return not (missing_numerical or missing_categorical)
 
-            return not (missing_numerical or missing_categorical)
+    # -------------------------------------------------------------------------
+    # Helper Method
+    # -------------------------------------------------------------------------
 
+    def read_data(self, file_path: str) -> DataFrame:
+        """
+        Load a CSV file safely, using the pyarrow parser and schema dtypes.
+        Only schema columns are parsed, numerical columns are downcast to
+        the narrowest dtype that holds them and categorical features (not
+        drop_columns such as case_id) are held as category codes, to cut
+        drift-test memory traffic.
+        """
+        try:
+            df = pd.read_csv(file_path,
+                             engine="pyarrow",
+                             dtype=self._csv_dtype_map,
+                             usecols=self._expected_cols)
+
+            for col in self._numerical_index.intersection(df.columns):
+                df[col] = self._downcast_numeric(df[col])
+
+            for col in self._categorical_features.intersection(df.columns):
+                if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                    df[col] = df[col].astype("category")
+
+            return df
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys)
 
-    # -------------------------------------------------------------------------
-    # Helper Method
-    # -------------------------------------------------------------------------
+    @staticmethod
+    def _downcast_numeric(series: pd.Series) -> pd.Series:
+        """
+        Narrow a numerical column without changing any value: integer columns
+        via downcast="integer", float columns (including integer data with
+        NaN) via downcast="float" only when float32 holds every value exactly.
+        """
+        if pd.api.types.is_integer_dtype(series):
+            return pd.to_numeric(series, downcast="integer")
+        if not pd.api.types.is_float_dtype(series):
+            return series
+
+        narrowed = pd.to_numeric(series, downcast="float")
+        if narrowed.dtype != series.dtype and not narrowed.astype(
+                series.dtype).equals(series):
+            return series
+        return narrowed
 
     @staticmethod
-    def read_data(file_path: str) -> DataFrame:
+    def _read_header(file_path: str) -> DataFrame:
         """
-        Load a CSV file safely.
+        Load only the header of a CSV file as an empty DataFrame.
         """
         try:
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, nrows=0)
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys)
 
+    @staticmethod
+    def _is_identical(reference_df: DataFrame, current_df: DataFrame) -> bool:
+        """
+        Check that both frames hold the same values row for row, by comparing
+        columns and the vectorized row hashes of every row. dtypes are not
+        compared, since category sets differ per file after read_data; a
+        column stored at a different numeric width hashes differently and
+        just means drift detection runs as usual.
+        """
+        if reference_df.shape != current_df.shape:
+            return False
+        if not reference_df.columns.equals(current_df.columns):
+            return False
+
+        reference_hash = pd.util.hash_pandas_object(reference_df, index=False)
+        current_hash = pd.util.hash_pandas_object(current_df, index=False)
+        return bool((reference_hash.to_numpy() == current_hash.to_numpy()).all())
+
     # -------------------------------------------------------------------------
     # Drift Detection (Updated for Evidently 0.7.17)
     # -------------------------------------------------------------------------
@@ -145,46 +257,47 @@ class DataValidation:
     def parse_evidently_metrics_to_profile_like(
             self,
             report_dict: Dict[str, Any],
-            reference_df=None) -> Dict[str, Any]:
+            n_features_hint: Optional[int] = None) -> Dict[str, Any]:
         """
         Convert Evidently 0.7.x 'metrics' list into a small dict with:
         - n_features
         - n_drifted_features
         - dataset_drift (boolean)
 
-        - report_dict: loaded JSON produced by report.save_json()
-        - reference_df: optional pandas DataFrame; used as authoritative column count
+        - report_dict: in-memory report produced by Snapshot.dict()
+        - n_features_hint: optional column count of the reference data; used as authoritative
         """
         metrics = report_dict.get("metrics", [])
-        # Find the DriftedColumnsCount metric entry
-        drifted_metric = None
+        # Index metrics by bare type name (config type is e.g.
+        # "evidently:metric_v2:DriftedColumnsCount"), then by metric_name
+        # (e.g. "DriftedColumnsCount(drift_share=0.5)"); first entry wins
+        by_type: Dict[str, Dict[str, Any]] = {}
         for m in metrics:
-            cfg_type = m.get("config", {}).get("type", "")
-            if cfg_type.endswith(
-                    "DriftedColumnsCount") or "DriftedColumnsCount" in m.get(
-                        "metric_name", ""):
-                drifted_metric = m
-                break
+            cfg_type = m.get("config", _EMPTY_MAPPING).get("type", "")
+            by_type.setdefault(re.split(r"[:.]", cfg_type)[-1], m)
+        for m in metrics:
+            by_type.setdefault(m.get("metric_name", "").split("(", 1)[0], m)
+
+        drifted_metric = by_type.get("DriftedColumnsCount")
 
         if drifted_metric is None:
             # If not found, fallback: no drift info
-            n_features = reference_df.shape[
-                1] if reference_df is not None else None
             return {
-                "n_features": n_features,
+                "n_features": n_features_hint,
                 "n_drifted_features": 0,
                 "dataset_drift": False,
                 "drift_share": 0.0,
-                "drift_count": 0
+                "drift_count": 0,
+                "drift_share_threshold": DEFAULT_DRIFT_SHARE_THRESHOLD
             }
 
-        value = drifted_metric.get("value", {})
+        value = drifted_metric.get("value", _EMPTY_MAPPING)
         count = value.get("count")
         share = value.get("share")
 
-        # fallback to reference_df column count if share is zero or missing
-        if reference_df is not None:
-            n_features = reference_df.shape[1]
+        # prefer the caller's column count; infer from count/share otherwise
+        if n_features_hint is not None:
+            n_features = n_features_hint
         else:
             # attempt to infer from count/share if possible
             if share and share != 0:
@@ -192,11 +305,11 @@ class DataValidation:
             else:
                 n_features = None
 
-        drift_share_threshold = drifted_metric.get("config",
-                                                   {}).get("drift_share")
-        # If config threshold missing, default to 0.5 (common)
+        drift_share_threshold = drifted_metric.get(
+            "config", _EMPTY_MAPPING).get("drift_share")
+        # If config threshold missing, fall back to Evidently's default
         if drift_share_threshold is None:
-            drift_share_threshold = 0.5
+            drift_share_threshold = DEFAULT_DRIFT_SHARE_THRESHOLD
 
         dataset_drift = False
         if share is not None:
@@ -211,31 +324,115 @@ class DataValidation:
             "drift_share_threshold": float(drift_share_threshold)
         }
 
+    def fast_drift_report(self, reference_df: DataFrame,
+                          current_df: DataFrame) -> Dict[str, Any]:
+        """
+        Lightweight alternative to Evidently's DataDriftPreset: a two-sample
+        KS test per numerical column and a chi-squared test per categorical
+        column. drop_columns (IDs) and the target are not tested. Returns a
+        report dict shaped like Evidently's so it goes through
+        parse_evidently_metrics_to_profile_like unchanged.
+        """
+        # scipy is only needed on this opt-in path
+        from scipy import stats
+
+        skip_cols = self._drop_set | {TARGET_COLUMN}
+        column_metrics = []
+
+        for col in sorted(self._numerical_set - skip_cols):
+            if col not in reference_df.columns or col not in current_df.columns:
+                continue
+            reference = reference_df[col].dropna().to_numpy()
+            current = current_df[col].dropna().to_numpy()
+            if len(reference) == 0 or len(current) == 0:
+                continue
+            p_value = stats.ks_2samp(reference, current, method="asymp").pvalue
+            column_metrics.append({
+                "metric_name": f"ValueDrift(column={col},method=K-S p_value)",
+                "config": {"type": "ValueDrift", "column": col},
+                "value": float(p_value),
+            })
+
+        for col in sorted(self._categorical_set - skip_cols):
+            if col not in reference_df.columns or col not in current_df.columns:
+                continue
+            table = pd.concat(
+                [reference_df[col].value_counts(),
+                 current_df[col].value_counts()],
+                axis=1).fillna(0)
+            # an all-NaN column on either side gives a zero column and
+            # unobserved categories give zero rows; both break chi2
+            if (table.sum(axis=0) == 0).any():
+                continue
+            table = table[table.sum(axis=1) > 0]
+            if len(table) < 2:
+                continue
+            p_value = stats.chi2_contingency(table.to_numpy()).pvalue
+            column_metrics.append({
+                "metric_name": f"ValueDrift(column={col},method=chi-square p_value)",
+                "config": {"type": "ValueDrift", "column": col},
+                "value": float(p_value),
+            })
+
+        count = sum(m["value"] < FAST_DRIFT_P_VALUE_THRESHOLD
+                    for m in column_metrics)
+        share = count / len(column_metrics) if column_metrics else 0.0
+
+        drifted_metric = {
+            "metric_name": f"DriftedColumnsCount(drift_share={DEFAULT_DRIFT_SHARE_THRESHOLD})",
+            "config": {
+                "type": "DriftedColumnsCount",
+                "drift_share": DEFAULT_DRIFT_SHARE_THRESHOLD,
+            },
+            "value": {"count": count, "share": share},
+        }
+        return {"metrics": [drifted_metric] + column_metrics}
+
     # ************************************************************
 
     def detect_dataset_drift(self, reference_df: DataFrame,
                              current_df: DataFrame) -> bool:
         """
         Run Evidently DataDriftPreset, save JSON, parse metrics and return boolean drift flag.
+        Evidently is skipped when both frames hold identical data.
         """
         try:
-            # Build & run the report
-            drift_report = Report(metrics=[DataDriftPreset()])
-            rendered = drift_report.run(reference_data=reference_df,
-                                        current_data=current_df)
-
-            # Save the raw report JSON to the configured path (this matches what you used)
-            json_path = self.data_validation_config.drift_report_file_path
-            os.makedirs(os.path.dirname(json_path), exist_ok=True)
-            rendered.save_json(json_path)
+            # The configured path holds the YAML summary; the full report goes
+            # to a JSON sibling so the slow YAML emitter only sees a few keys
+            yaml_path = self.data_validation_config.drift_report_file_path
+            json_path = None
 
-            # Load the JSON back into a dict
-            with open(json_path, "r", encoding="utf-8") as f:
-                report_dict = json.load(f)
+            if self._is_identical(reference_df, current_df):
+                # Nothing can have drifted, skip Evidently entirely
+                logging.info(
+                    "Reference and current data are identical; skipping Evidently drift report")
+                report_dict: Dict[str, Any] = {"metrics": []}
+            else:
+                if self.data_validation_config.use_fast_drift:
+                    report_dict = self.fast_drift_report(
+                        reference_df, current_df)
+                else:
+                    # Evidently pulls in plotly/scipy/sklearn; import on first use
+                    from evidently.core.report import Report
+                    from evidently.presets import DataDriftPreset
+
+                    # Build & run the report
+                    drift_report = Report(metrics=[DataDriftPreset()])
+                    rendered = drift_report.run(reference_data=reference_df,
+                                                current_data=current_df)
+
+                    # Use the in-memory report instead of a save_json/json.load round-trip
+                    report_dict = rendered.dict()
+                    # the snapshot holds references to both DataFrames
+                    del rendered, drift_report
+
+                if not self.data_validation_config.skip_report_generation:
+                    json_path = os.path.splitext(yaml_path)[0] + ".json"
+                    write_json_file(file_path=json_path, content=report_dict)
 
             # Parse new metrics list into old-style numbers
             parsed = self.parse_evidently_metrics_to_profile_like(
-                report_dict, reference_df=reference_df)
+                report_dict, n_features_hint=reference_df.shape[1])
 
             # Build a small report dict in the old 'profile' shape if other code expects that nesting
             profile_like = {
@@ -255,21 +452,10 @@ class DataValidation:
                         }
                     }
                 },
-                # also keep the raw metrics for completeness
-                "raw_metrics": report_dict.get("metrics", []),
+                # the raw metrics live in the JSON report written above, if any
+                "raw_report_file_path": json_path,
             }
 
-            # Save YAML (your pipeline expects YAML); write_yaml_file should accept dicts
-            # write_yaml_file(file_path=json_path.replace(".json", ".yaml"), content=profile_like)
-            # Or if you MUST write to same drift_report_file_path, use it:
-            # write_yaml_file(
-            #     file_path=self.data_validation_config.drift_report_file_path,
-            #     content=profile_like)
-
-            # write_yaml_file(self.data_validation_config.drift_report_file_path, report_dict)
-
-            yaml_path = json_path.replace(".json", ".yaml")
-            os.makedirs(os.path.dirname(yaml_path), exist_ok=True)
             write_yaml_file(file_path=yaml_path, content=profile_like)
 
             # Log and return
@@ -294,31 +480,42 @@ class DataValidation:
         try:
             logging.info("Starting data validation process...")
 
-            # Load data
-            train_df = self.read_data(
+            # Schema checks only need the headers
+            train_header = self._read_header(
                 self.data_ingestion_artifact.trained_file_path)
-            test_df = self.read_data(
+            test_header = self._read_header(
                 self.data_ingestion_artifact.test_file_path)
 
             error_messages = []
 
             # Column count validation
-            if not self.validate_number_of_columns(train_df):
+            if not self.validate_number_of_columns(train_header):
                 error_messages.append("Training data: Column count mismatch.")
-            if not self.validate_number_of_columns(test_df):
+            if not self.validate_number_of_columns(test_header):
                 error_messages.append("Test data: Column count mismatch.")
 
             # Column existence validation
-            if not self.is_column_exist(train_df):
+            if not self.is_column_exist(train_header):
                 error_messages.append(
                     "Training data: Missing required columns.")
-            if not self.is_column_exist(test_df):
+            if not self.is_column_exist(test_header):
                 error_messages.append("Test data: Missing required columns.")
 
             validation_passed = len(error_messages) == 0
 
             drift_status = False
             if validation_passed:
+                # Full parse only once the schema checks have passed; the two
+                # reads are independent and the parser releases the GIL
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    train_future = executor.submit(
+                        self.read_data,
+                        self.data_ingestion_artifact.trained_file_path)
+                    test_future = executor.submit(
+                        self.read_data,
+                        self.data_ingestion_artifact.test_file_path)
+                    train_df = train_future.result()
+                    test_df = test_future.result()
                 drift_status = self.detect_dataset_drift(train_df, test_df)
 
             message = ("Drift detected"
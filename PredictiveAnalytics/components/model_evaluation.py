@@ -6,12 +6,14 @@ from PredictiveAnalytics.constants import TARGET_COLUMN, CURRENT_YEAR
 from PredictiveAnalytics.logger import logging
 import sys
 import pandas as pd
-from typing import Optional
-from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
+from typing import TYPE_CHECKING, Optional
 from dataclasses import dataclass
 from PredictiveAnalytics.entity.estimator import TravelModel
 from PredictiveAnalytics.entity.estimator import TargetValueMapping
 
+if TYPE_CHECKING:
+    from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
+
 @dataclass
 class EvaluateModelResponse:
     trained_model_f1_score: float
@@ -31,7 +33,7 @@ class ModelEvaluation:
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys) from e
 
-    def get_best_model(self) -> Optional[TravelEstimator]:
+    def get_best_model(self) -> Optional["TravelEstimator"]:
         """
         Method Name :   get_best_model
         Description :   This function is used to get model in production
@@ -40,6 +42,9 @@ class ModelEvaluation:
         On Failure  :   Write an exception log and then raise an exception
         """
         try:
+            # s3_estimator pulls in boto3; import on first use
+            from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
+
             bucket_name = self.model_eval_config.bucket_name
             model_path=self.model_eval_config.s3_model_key_path
             travel_estimator = TravelEstimator(bucket_name=bucket_name,
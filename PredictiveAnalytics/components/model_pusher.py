@@ -1,11 +1,9 @@
 import sys
 
-from PredictiveAnalytics.cloud_storage.aws_storage import SimpleStorageService
 from PredictiveAnalytics.exception import PredictiveAnalyticsException
 from PredictiveAnalytics.logger import logging
 from PredictiveAnalytics.entity.artifact_entity import ModelPusherArtifact, ModelEvaluationArtifact
 from PredictiveAnalytics.entity.config_entity import ModelPusherConfig
-from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
 
 
 class ModelPusher:
@@ -15,6 +13,10 @@ class ModelPusher:
         :param model_evaluation_artifact: Output reference of data evaluation artifact stage
         :param model_pusher_config: Configuration for model pusher
         """
+        # aws_storage/s3_estimator pull in boto3; import on first use
+        from PredictiveAnalytics.cloud_storage.aws_storage import SimpleStorageService
+        from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
+
         self.s3 = SimpleStorageService()
         self.model_evaluation_artifact = model_evaluation_artifact
         self.model_pusher_config = model_pusher_config
@@ -4,8 +4,9 @@ from PredictiveAnalytics.exception import PredictiveAnalyticsException
 from PredictiveAnalytics.logger import logging
 
 import os
-from PredictiveAnalytics.constants import DATABASE_NAME, MONGODB_URL_KEY
-import pymongo
+import threading
+from PredictiveAnalytics.constants import (DATABASE_NAME, MONGODB_URL_KEY,
+                                           MONGODB_MAX_POOL_SIZE, MONGODB_MIN_POOL_SIZE)
 import certifi
 
 from dotenv import load_dotenv
@@ -23,15 +24,29 @@ class MongoDBClient:
     On Failure  :   raises an exception
     """
     client = None
+    _client_lock = threading.Lock()
 
     def __init__(self, database_name=DATABASE_NAME) -> None:
     # def __init__(self, database_name=DATABASE_NAME):
         try:
             if MongoDBClient.client is None:
-                mongo_db_url = os.getenv('MONGODB_URL_KEY')
-                if mongo_db_url is None:
-                    raise Exception(f"Environment key: {MONGODB_URL_KEY} is not set.")
-                MongoDBClient.client = pymongo.MongoClient(mongo_db_url, tlsCAFile=ca)
+                # double-checked so concurrent workers share a single MongoClient
+                with MongoDBClient._client_lock:
+                    if MongoDBClient.client is None:
+                        # pymongo is imported here so importing this module stays cheap
+                        import pymongo
+                        from pymongo.server_api import ServerApi
+
+                        mongo_db_url = os.getenv('MONGODB_URL_KEY')
+                        if mongo_db_url is None:
+                            raise Exception(f"Environment key: {MONGODB_URL_KEY} is not set.")
+                        MongoDBClient.client = pymongo.MongoClient(
+                            mongo_db_url,
+                            tlsCAFile=ca,
+                            server_api=ServerApi('1'),
+                            maxPoolSize=MONGODB_MAX_POOL_SIZE,
+                            minPoolSize=MONGODB_MIN_POOL_SIZE,
+                        )
             self.client = MongoDBClient.client
             self.database = self.client[database_name]
             self.database_name = database_name
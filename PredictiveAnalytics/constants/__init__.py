@@ -8,6 +8,8 @@ DATABASE_NAME = "mlops_db"
 COLLECTION_NAME = "travel"
 
 MONGODB_URL_KEY = os.getenv("MONGODB_URL_KEY")
+MONGODB_MAX_POOL_SIZE: int = 50
+MONGODB_MIN_POOL_SIZE: int = 1
 
 PIPELINE_NAME: str = "travelPipeline"
 ARTIFACT_DIR: str = "artifact"
@@ -49,6 +51,8 @@ Data Validation realted contant start with DATA_VALIDATION VAR NAME
 DATA_VALIDATION_DIR_NAME: str = "data_validation"
 DATA_VALIDATION_DRIFT_REPORT_DIR: str = "drift_report"
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME: str = "report.yaml"
+DATA_VALIDATION_SKIP_REPORT_GENERATION: bool = False
+DATA_VALIDATION_USE_FAST_DRIFT: bool = False
 
 
 
@@ -33,6 +33,8 @@ class DataValidationConfig:
     data_validation_dir: str = os.path.join(training_pipeline_config.artifact_dir, DATA_VALIDATION_DIR_NAME)
     drift_report_file_path: str = os.path.join(data_validation_dir, DATA_VALIDATION_DRIFT_REPORT_DIR,
                                                DATA_VALIDATION_DRIFT_REPORT_FILE_NAME)
+    skip_report_generation: bool = DATA_VALIDATION_SKIP_REPORT_GENERATION
+    use_fast_drift: bool = DATA_VALIDATION_USE_FAST_DRIFT
     
 
 
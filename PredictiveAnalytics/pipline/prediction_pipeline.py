@@ -1,61 +1,83 @@
 import os
 import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, ClassVar, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
 from PredictiveAnalytics.entity.config_entity import TravelPredictorConfig
-from PredictiveAnalytics.entity.s3_estimator import  TravelEstimator
 from PredictiveAnalytics.exception import PredictiveAnalyticsException
 from PredictiveAnalytics.logger import logging
 from PredictiveAnalytics.utils.main_utils import read_yaml_file
 from pandas import DataFrame
 
+if TYPE_CHECKING:
+    from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
 
-class TravelData:
-    def __init__(self,
-                continent,
-                education_of_employee,
-                has_job_experience,
-                requires_job_training,
-                no_of_employees,
-                region_of_employment,
-                prevailing_wage,
-                unit_of_wage,
-                full_time_position,
-                company_age
-                ):
-        """
-        TRavel Data constructor
-        Input: all features of the trained model for prediction
-        """
-        try:
-            self.continent = continent
-            self.education_of_employee = education_of_employee
-            self.has_job_experience = has_job_experience
-            self.requires_job_training = requires_job_training
-            self.no_of_employees = no_of_employees
-            self.region_of_employment = region_of_employment
-            self.prevailing_wage = prevailing_wage
-            self.unit_of_wage = unit_of_wage
-            self.full_time_position = full_time_position
-            self.company_age = company_age
 
-
-        except Exception as e:
-            raise PredictiveAnalyticsException(e, sys) from e
+@dataclass(slots=True, frozen=True)
+class TravelData:
+    """
+    Travel Data container
+    Input: all features of the trained model for prediction, as the raw
+    form values app.py receives (numerical fields included)
+    """
+    continent: Optional[str]
+    education_of_employee: Optional[str]
+    has_job_experience: Optional[str]
+    requires_job_training: Optional[str]
+    no_of_employees: Optional[str]
+    region_of_employment: Optional[str]
+    prevailing_wage: Optional[str]
+    unit_of_wage: Optional[str]
+    full_time_position: Optional[str]
+    company_age: Optional[str]
+
+    # Feature order expected by the preprocessing pipeline
+    _COLUMNS: ClassVar[Tuple[str, ...]] = (
+        "continent",
+        "education_of_employee",
+        "has_job_experience",
+        "requires_job_training",
+        "no_of_employees",
+        "region_of_employment",
+        "prevailing_wage",
+        "unit_of_wage",
+        "full_time_position",
+        "company_age",
+    )
 
     def get_travel_input_data_frame(self)-> DataFrame:
         """
         This function returns a DataFrame from TravelData class input
         """
-        try:
-            
-            usvisa_input_dict = self.get_travel_data_as_dict()
-            return DataFrame(usvisa_input_dict)
-        
-        except Exception as e:
-            raise PredictiveAnalyticsException(e, sys) from e
+        # one row plus column names is cheaper than a dict of 1-element lists
+        return DataFrame([self.get_travel_data_as_row()], columns=list(self._COLUMNS))
+
 
+    def get_travel_data_as_row(self) -> list:
+        """
+        This function returns the TravelData class input as a list ordered like _COLUMNS
+        """
+        return [
+            self.continent,
+            self.education_of_employee,
+            self.has_job_experience,
+            self.requires_job_training,
+            self.no_of_employees,
+            self.region_of_employment,
+            self.prevailing_wage,
+            self.unit_of_wage,
+            self.full_time_position,
+            self.company_age,
+        ]
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        This function returns the TravelData class input as a 1 x n object array ordered like _COLUMNS
+        """
+        return np.array([self.get_travel_data_as_row()], dtype=object)
 
     def get_travel_data_as_dict(self):
         """
@@ -63,28 +85,42 @@ class TravelData:
         """
         logging.info("Entered get_travel_data_as_dict method as TravelData class")
 
-        try:
-            input_data = {
-                "continent": [self.continent],
-                "education_of_employee": [self.education_of_employee],
-                "has_job_experience": [self.has_job_experience],
-                "requires_job_training": [self.requires_job_training],
-                "no_of_employees": [self.no_of_employees],
-                "region_of_employment": [self.region_of_employment],
-                "prevailing_wage": [self.prevailing_wage],
-                "unit_of_wage": [self.unit_of_wage],
-                "full_time_position": [self.full_time_position],
-                "company_age": [self.company_age],
-            }
+        input_data = {
+            "continent": [self.continent],
+            "education_of_employee": [self.education_of_employee],
+            "has_job_experience": [self.has_job_experience],
+            "requires_job_training": [self.requires_job_training],
+            "no_of_employees": [self.no_of_employees],
+            "region_of_employment": [self.region_of_employment],
+            "prevailing_wage": [self.prevailing_wage],
+            "unit_of_wage": [self.unit_of_wage],
+            "full_time_position": [self.full_time_position],
+            "company_age": [self.company_age],
+        }
 
-            logging.info("Created usvisa data dict")
+        logging.info("Created usvisa data dict")
 
-            logging.info("Exited get_travel_data_as_dict method as TravelData class")
+        logging.info("Exited get_travel_data_as_dict method as TravelData class")
 
-            return input_data
+        return input_data
+
+@lru_cache(maxsize=4)
+def _get_travel_estimator(bucket_name: str, model_path: str) -> "TravelEstimator":
+    """
+    Shared TravelEstimator per (bucket, model path) so the S3 model is loaded once per process
+    """
+    # s3_estimator pulls in boto3; import on first use
+    from PredictiveAnalytics.entity.s3_estimator import TravelEstimator
+
+    return TravelEstimator(bucket_name=bucket_name, model_path=model_path)
+
+
+def clear_travel_estimator_cache() -> None:
+    """
+    Drop the cached estimators so the next TravelClassifier loads the model currently in S3
+    """
+    _get_travel_estimator.cache_clear()
 
-        except Exception as e:
-            raise PredictiveAnalyticsException(e, sys) from e
 
 class TravelClassifier:
     def __init__(self,prediction_pipeline_config: TravelPredictorConfig = TravelPredictorConfig(),) -> None:
@@ -94,6 +130,20 @@ class TravelClassifier:
         try:
             # self.schema_config = read_yaml_file(SCHEMA_FILE_PATH)
             self.prediction_pipeline_config = prediction_pipeline_config
+            self._estimator = _get_travel_estimator(
+                bucket_name=self.prediction_pipeline_config.model_bucket_name,
+                model_path=self.prediction_pipeline_config.model_file_path,
+            )
+        except Exception as e:
+            raise PredictiveAnalyticsException(e, sys)
+
+    def refresh(self) -> None:
+        """
+        Reload the model from S3, e.g. after a new model has been pushed
+        """
+        try:
+            logging.info("Reloading model in TravelClassifier")
+            self._estimator.loaded_model = self._estimator.load_model()
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys)
 
@@ -105,13 +155,26 @@ class TravelClassifier:
         """
         try:
             logging.info("Entered predict method of TravelClassifier class")
-            model = TravelEstimator(
-                bucket_name=self.prediction_pipeline_config.model_bucket_name,
-                model_path=self.prediction_pipeline_config.model_file_path,
-            )
-            result =  model.predict(dataframe)
+            result = self._estimator.predict(dataframe)
             
             return result
         
         except Exception as e:
-            raise PredictiveAnalyticsException(e, sys)
\ No newline at end of file
+            raise PredictiveAnalyticsException(e, sys)
+
+    def predict_batch(self, travel_data: List[TravelData]) -> np.ndarray:
+        """
+        This is the method of TravelClassifier
+        Runs a single vectorized prediction over many TravelData inputs
+        Returns: Array of predictions, in input order
+        """
+        try:
+            logging.info("Entered predict_batch method of TravelClassifier class")
+            dataframe = DataFrame(
+                [item.get_travel_data_as_row() for item in travel_data],
+                columns=list(TravelData._COLUMNS),
+            )
+            return self._estimator.predict(dataframe)
+
+        except Exception as e:
+            raise PredictiveAnalyticsException(e, sys)
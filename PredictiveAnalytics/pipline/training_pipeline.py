@@ -7,6 +7,7 @@ from PredictiveAnalytics.components.data_transformation import DataTransformatio
 from PredictiveAnalytics.components.model_trainer import ModelTrainer
 from PredictiveAnalytics.components.model_evaluation import ModelEvaluation
 from PredictiveAnalytics.components.model_pusher import ModelPusher
+from PredictiveAnalytics.pipline.prediction_pipeline import clear_travel_estimator_cache
 
 
 from PredictiveAnalytics.entity.config_entity import (DataIngestionConfig,
@@ -163,6 +164,9 @@ class TrainPipeline:
                 return None
             model_pusher_artifact = self.start_model_pusher(model_evaluation_artifact=model_evaluation_artifact)
 
+            # predictions served from this process must pick up the newly pushed model
+            clear_travel_estimator_cache()
+
         except Exception as e:
             raise PredictiveAnalyticsException(e, sys)
         
@@ -3,6 +3,7 @@ import sys
 
 import numpy as np
 import dill
+import orjson
 import yaml
 from pandas import DataFrame
 
@@ -10,10 +11,40 @@ from PredictiveAnalytics.exception import PredictiveAnalyticsException
 from PredictiveAnalytics.logger import logging
 
 
+# Directories already created by this process, to skip repeat makedirs calls
+_MKDIR_CACHE: set = set()
+
+
+def _ensure_dir(dir_path: str) -> None:
+    if dir_path not in _MKDIR_CACHE:
+        os.makedirs(dir_path, exist_ok=True)
+        _MKDIR_CACHE.add(dir_path)
+
+
+def _open_for_write(file_path: str, mode: str):
+    """
+    Open file_path for writing, creating its directory on first use. If the
+    directory was removed after being cached, recreate it and retry once.
+    """
+    dir_path = os.path.dirname(file_path)
+    _ensure_dir(dir_path)
+    try:
+        return open(file_path, mode)
+    except FileNotFoundError:
+        _MKDIR_CACHE.discard(dir_path)
+        os.makedirs(dir_path, exist_ok=True)
+        _MKDIR_CACHE.add(dir_path)
+        return open(file_path, mode)
+
+
+# libyaml C loader when PyYAML was built with it, pure-Python loader otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def read_yaml_file(file_path: str) -> dict:
     try:
         with open(file_path, "rb") as yaml_file:
-            return yaml.safe_load(yaml_file)
+            return yaml.load(yaml_file, Loader=_YAML_LOADER)
 
     except Exception as e:
         raise PredictiveAnalyticsException(e, sys) from e
@@ -25,14 +56,32 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
         if replace:
             if os.path.exists(file_path):
                 os.remove(file_path)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        with open(file_path, "w") as file:
+        with _open_for_write(file_path, "w") as file:
             yaml.dump(content, file)
     except Exception as e:
         raise PredictiveAnalyticsException(e, sys) from e
     
 
 
+def write_json_file(file_path: str, content: object) -> None:
+    """
+    Serialize content with orjson and write the bytes straight to file
+    file_path: str location of file to save
+    content: dict/list to save; numpy arrays and scalars are serialized natively,
+             non-str keys are allowed and any other unknown object falls back to str()
+    """
+    try:
+        with _open_for_write(file_path, "wb") as file:
+            file.write(
+                orjson.dumps(
+                    content,
+                    default=str,
+                    option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+                ))
+    except Exception as e:
+        raise PredictiveAnalyticsException(e, sys) from e
+
+
 
 def load_object(file_path: str) -> object:
     logging.info("Entered the load_object method of utils")